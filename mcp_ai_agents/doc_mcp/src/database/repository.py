@@ -33,13 +33,24 @@ class RepositoryManager:
     def get_repository_details(self) -> List[Dict[str, Any]]:
         """Get detailed information about all repositories."""
         try:
-            repos = []
-            for repo_doc in self.repos_collection.find():
-                # Count documents for this repo
-                repo_name = repo_doc.get("repo_name", "Unknown")
-                doc_count = self.docs_collection.count_documents(
-                    {"metadata.repo": repo_name}
+            repo_docs = list(self.repos_collection.find())
+
+            # Count documents for all repos in one aggregation instead of one
+            # count_documents round trip per repo
+            repo_names = [doc.get("repo_name", "Unknown") for doc in repo_docs]
+            doc_counts = {
+                row["_id"]: row["count"]
+                for row in self.docs_collection.aggregate(
+                    [
+                        {"$match": {"metadata.repo": {"$in": repo_names}}},
+                        {"$group": {"_id": "$metadata.repo", "count": {"$sum": 1}}},
+                    ]
                 )
+            }
+
+            repos = []
+            for repo_doc, repo_name in zip(repo_docs, repo_names):
+                doc_count = doc_counts.get(repo_name, 0)
 
                 # Get file tracking info
                 files_info = repo_doc.get("files", [])
@@ -114,6 +125,9 @@ class RepositoryManager:
             if files_with_sha is None:
                 files_with_sha = []
 
+            # One timestamp for the whole update keeps the entries consistent
+            now = datetime.now()
+
             # Get existing repository data
             existing_repo = self.repos_collection.find_one({"_id": repo_name})
 
@@ -127,7 +141,7 @@ class RepositoryManager:
                     existing_file_lookup[file_info["path"]] = {
                         "path": file_info["path"],
                         "sha": file_info["sha"],
-                        "last_ingested": datetime.now(),
+                        "last_ingested": now,
                         "status": "ingested",
                     }
 
@@ -139,7 +153,7 @@ class RepositoryManager:
                     "$set": {
                         "files": merged_files,
                         "file_count": len(merged_files),  # Use actual count
-                        "last_updated": datetime.now(),
+                        "last_updated": now,
                         "status": ProcessingStatus.COMPLETE.value,
                         "branch": branch,
                         "tracking_enabled": True,
@@ -161,7 +175,7 @@ class RepositoryManager:
                         {
                             "path": file_info["path"],
                             "sha": file_info["sha"],
-                            "last_ingested": datetime.now(),
+                            "last_ingested": now,
                             "status": "ingested",
                         }
                     )
@@ -172,7 +186,7 @@ class RepositoryManager:
                     "branch": branch,
                     "file_count": len(file_tracking_data),
                     "files": file_tracking_data,
-                    "last_updated": datetime.now(),
+                    "last_updated": now,
                     "status": ProcessingStatus.COMPLETE.value,
                     "tracking_enabled": True,
                 }
@@ -292,11 +306,11 @@ class RepositoryManager:
                 f"{repo_name}:{branch}:{path}" for path in file_paths
             ]  # Adjust branch if needed
 
-            # Delete from vector store
-            deleted_count = 0
-            for doc_id in doc_ids:
-                result = self.docs_collection.delete_many({"metadata.doc_id": doc_id})
-                deleted_count += result.deleted_count
+            # Delete from vector store in a single round trip
+            result = self.docs_collection.delete_many(
+                {"metadata.doc_id": {"$in": doc_ids}}
+            )
+            deleted_count = result.deleted_count
 
             logger.info(
                 f"Deleted {deleted_count} documents for {len(file_paths)} files from {repo_name}"
@@ -3,7 +3,7 @@
 import logging
 
 from llama_index.vector_stores.mongodb import MongoDBAtlasVectorSearch
-from pymongo.operations import SearchIndexModel
+from pymongo.operations import IndexModel, SearchIndexModel
 
 from ..core.config import settings
 from ..core.exceptions import VectorStoreError
@@ -66,6 +66,14 @@ def get_vector_store() -> MongoDBAtlasVectorSearch:
             # Indexes might already exist
             logger.info(f"Search indexes might already exist: {e}")
 
+        # Secondary indexes for repo/file lookups used by counts and deletes
+        try:
+            collection.create_indexes(
+                [IndexModel("metadata.repo"), IndexModel("metadata.doc_id")]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to create metadata indexes: {e}")
+
         return vector_store
 
     except Exception as e:
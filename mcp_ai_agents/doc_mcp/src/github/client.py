@@ -32,6 +32,10 @@ class GitHubClient:
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
 
+        # Reuse the HTTP connection across repository tree requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
     def _handle_response_errors(self, response: requests.Response, repo_name: str):
         """Handle common GitHub API response errors."""
         if response.status_code == 404:
@@ -69,22 +73,20 @@ class GitHubClient:
         api_url = build_github_api_url(owner, repo, branch=branch)
 
         try:
-            response = requests.get(
-                api_url, headers=self.headers, timeout=settings.github_timeout
-            )
+            response = self.session.get(api_url, timeout=settings.github_timeout)
 
             self._handle_response_errors(response, repo_name)
 
             data = response.json()
             filtered_files = []
 
+            # Lower-case the extensions once instead of once per tree entry
+            extensions = tuple(ext.lower() for ext in file_extensions)
+
             for item in data.get("tree", []):
                 if item["type"] == "blob":
                     file_path = item["path"]
-                    if any(
-                        file_path.lower().endswith(ext.lower())
-                        for ext in file_extensions
-                    ):
+                    if file_path.lower().endswith(extensions):
                         if include_sha:
                             file_data = {"path": file_path, "sha": item["sha"]}
                             filtered_files.append(file_data)
@@ -104,11 +106,41 @@ class GitHubClient:
         except requests.exceptions.RequestException as e:
             raise GitHubError(f"Network error: {str(e)}") from e
 
+    def _create_session(self, limit_per_host: int = 0) -> aiohttp.ClientSession:
+        """Create an aiohttp session with GitHub headers and pooled connections."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=limit_per_host, ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=ClientTimeout(total=settings.github_timeout),
+            connector=connector,
+        )
+
     async def get_file_content(
-        self, repo_url: str, file_path: str, branch: str = "main"
+        self,
+        repo_url: str,
+        file_path: str,
+        branch: str = "main",
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> GitHubFileInfo:
         """Get single file content asynchronously."""
 
+        if session is not None:
+            return await self._fetch_file_content(session, repo_url, file_path, branch)
+
+        async with self._create_session() as session:
+            return await self._fetch_file_content(session, repo_url, file_path, branch)
+
+    async def _fetch_file_content(
+        self,
+        session: aiohttp.ClientSession,
+        repo_url: str,
+        file_path: str,
+        branch: str,
+    ) -> GitHubFileInfo:
+        """Fetch and decode a single file using an existing session."""
+
         try:
             owner, repo = parse_github_url(repo_url)
         except Exception as e:
@@ -116,62 +148,49 @@ class GitHubClient:
 
         api_url = build_github_api_url(owner, repo, file_path, branch)
 
-        timeout = ClientTimeout(total=settings.github_timeout)
-
-        async with aiohttp.ClientSession(
-            headers=self.headers, timeout=timeout
-        ) as session:
-            try:
-                async with session.get(api_url) as response:
-                    if response.status == 404:
-                        raise GitHubRepositoryNotFoundError(
-                            f"File not found: {file_path}"
-                        )
-                    elif response.status == 403:
-                        raise GitHubRateLimitError("API rate limit exceeded")
-                    elif response.status != 200:
-                        raise GitHubError(
-                            f"HTTP {response.status}: {await response.text()}"
-                        )
-
-                    data = await response.json()
-
-                    if isinstance(data, list):
-                        raise GitHubError(
-                            f"Path {file_path} is a directory, not a file"
-                        )
-
-                    # Decode content
-                    if data.get("encoding") == "base64":
-                        try:
-                            content_bytes = base64.b64decode(data["content"])
-                            content_text = content_bytes.decode("utf-8")
-                        except UnicodeDecodeError:
-                            content_text = content_bytes.decode(
-                                "latin-1", errors="ignore"
-                            )
-                    else:
-                        raise GitHubError(
-                            f"Unsupported encoding: {data.get('encoding')}"
-                        )
-
-                    return GitHubFileInfo(
-                        path=file_path,
-                        name=data.get("name", ""),
-                        sha=data.get("sha", ""),
-                        size=data.get("size", 0),
-                        url=data.get("html_url", ""),
-                        download_url=data.get("download_url", ""),
-                        type=data.get("type", "file"),
-                        encoding=data.get("encoding", ""),
-                        content=content_text,
+        try:
+            async with session.get(api_url) as response:
+                if response.status == 404:
+                    raise GitHubRepositoryNotFoundError(f"File not found: {file_path}")
+                elif response.status == 403:
+                    raise GitHubRateLimitError("API rate limit exceeded")
+                elif response.status != 200:
+                    raise GitHubError(
+                        f"HTTP {response.status}: {await response.text()}"
                     )
-            except asyncio.TimeoutError:
-                raise GitHubError(
-                    f"Request timeout after {settings.github_timeout} seconds"
-                ) from None
-            except aiohttp.ClientError as e:
-                raise GitHubError(f"Network error: {str(e)}") from e
+
+                data = await response.json()
+
+                if isinstance(data, list):
+                    raise GitHubError(f"Path {file_path} is a directory, not a file")
+
+                # Decode content
+                if data.get("encoding") == "base64":
+                    try:
+                        content_bytes = base64.b64decode(data["content"])
+                        content_text = content_bytes.decode("utf-8")
+                    except UnicodeDecodeError:
+                        content_text = content_bytes.decode("latin-1", errors="ignore")
+                else:
+                    raise GitHubError(f"Unsupported encoding: {data.get('encoding')}")
+
+                return GitHubFileInfo(
+                    path=file_path,
+                    name=data.get("name", ""),
+                    sha=data.get("sha", ""),
+                    size=data.get("size", 0),
+                    url=data.get("html_url", ""),
+                    download_url=data.get("download_url", ""),
+                    type=data.get("type", "file"),
+                    encoding=data.get("encoding", ""),
+                    content=content_text,
+                )
+        except asyncio.TimeoutError:
+            raise GitHubError(
+                f"Request timeout after {settings.github_timeout} seconds"
+            ) from None
+        except aiohttp.ClientError as e:
+            raise GitHubError(f"Network error: {str(e)}") from e
 
     async def get_multiple_files(
         self,
@@ -187,20 +206,25 @@ class GitHubClient:
 
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def fetch_single_file(
-            file_path: str,
-        ) -> Tuple[Optional[GitHubFileInfo], Optional[str]]:
-            async with semaphore:
-                try:
-                    file_info = await self.get_file_content(repo_url, file_path, branch)
-                    return file_info, None
-                except Exception as e:
-                    logger.error(f"Failed to fetch {file_path}: {e}")
-                    return None, file_path
-
-        # Execute all file fetches concurrently
-        tasks = [fetch_single_file(path) for path in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        # Share one session so fetches reuse keep-alive connections
+        async with self._create_session(limit_per_host=max_concurrent) as session:
+
+            async def fetch_single_file(
+                file_path: str,
+            ) -> Tuple[Optional[GitHubFileInfo], Optional[str]]:
+                async with semaphore:
+                    try:
+                        file_info = await self.get_file_content(
+                            repo_url, file_path, branch, session=session
+                        )
+                        return file_info, None
+                    except Exception as e:
+                        logger.error(f"Failed to fetch {file_path}: {e}")
+                        return None, file_path
+
+            # Execute all file fetches concurrently
+            tasks = [fetch_single_file(path) for path in file_paths]
+            results = await asyncio.gather(*tasks, return_exceptions=False)
 
         successful_files = []
         failed_files = []
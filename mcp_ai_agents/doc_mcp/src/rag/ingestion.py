@@ -66,7 +66,7 @@ class DocumentIngestionPipeline:
             logger.warning("No documents to ingest")
             return False
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         total_docs = len(documents)
 
         try:
@@ -84,7 +84,7 @@ class DocumentIngestionPipeline:
             )
 
             # Report completion
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
 
             # Update repository metadata with SHA tracking
             if files_with_sha is None:
@@ -109,7 +109,7 @@ class DocumentIngestionPipeline:
             return True
 
         except Exception as e:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             logger.error(f"Ingestion failed after {elapsed_time:.2f}s: {e}")
 
             # Report error
@@ -60,7 +60,7 @@ class QueryRetriever:
         Returns:
             Dictionary with response and source nodes
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Validate inputs
@@ -101,7 +101,7 @@ class QueryRetriever:
                     continue
 
             # Format response (matching working code structure)
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             result = {
                 "response": str(
                     response.response
@@ -119,7 +119,7 @@ class QueryRetriever:
             return result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             logger.error(f"Query failed after {processing_time:.2f}s: {e}")
 
             return {
@@ -264,7 +264,7 @@ class IngestionTab:
             return
 
         total_files = len(selected_files)
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Parse repo name from URL
         if "github.com" in repo_url:
@@ -317,7 +317,7 @@ class IngestionTab:
                 repo_url, selected_files, branch=branch, max_concurrent=10
             )
 
-            loading_time = time.time() - start_time
+            loading_time = time.perf_counter() - start_time
 
             # Extract SHA information from loaded documents for tracking
             files_with_sha = []
@@ -356,7 +356,7 @@ class IngestionTab:
             )
 
         except Exception as e:
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.error(f"File loading error after {total_time:.1f}s: {e}")
 
             error_progress = {
@@ -400,7 +400,7 @@ class IngestionTab:
             }
             return error_progress, format_progress_display(error_progress)
 
-        vector_start_time = time.time()
+        vector_start_time = time.perf_counter()
 
         try:
             logger.info(
@@ -412,7 +412,7 @@ class IngestionTab:
                 documents, repo_name, branch=branch, files_with_sha=files_with_sha
             )
 
-            vector_time = time.time() - vector_start_time
+            vector_time = time.perf_counter() - vector_start_time
             loading_time = current_progress.get("loading_time", 0)
             total_time = loading_time + vector_time
 
@@ -456,7 +456,7 @@ class IngestionTab:
             return complete_progress, format_progress_display(complete_progress)
 
         except Exception as e:
-            vector_time = time.time() - vector_start_time
+            vector_time = time.perf_counter() - vector_start_time
             logger.error(f"Vector ingestion error after {vector_time:.2f}s: {e}")
 
             # Get failed files data safely
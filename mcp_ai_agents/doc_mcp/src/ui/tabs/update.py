@@ -482,7 +482,7 @@ class UpdateTab:
             return
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Initial progress
             initial_progress = {
@@ -554,7 +554,7 @@ class UpdateTab:
                 documents, repo_name, branch=branch, files_with_sha=files_with_sha
             )
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             if success:
                 # Get current repository stats
@@ -607,7 +607,7 @@ class UpdateTab:
             return error_progress, format_progress_display(error_progress)
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # This needs to be async, so let's create an async wrapper
             import asyncio
@@ -633,7 +633,7 @@ class UpdateTab:
                         branch=branch,
                         files_with_sha=files_with_sha,
                     )
-                    processing_time = time.time() - start_time
+                    processing_time = time.perf_counter() - start_time
 
                     if success:
                         completion_progress = {